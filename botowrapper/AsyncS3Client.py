@@ -1,30 +1,106 @@
 import aioboto3
 import asyncio
+import inspect
+import os
 from os import PathLike
 from typing import AsyncGenerator, Any, BinaryIO, Mapping
 from pathlib import Path
-from contextlib import asynccontextmanager
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from botowrapper.helpers import check_bucket_selected
 
+# a Session is stateless config and costs ~tens of ms to build,
+# so one per process is enough
+_SESSION = aioboto3.Session()
+
+# objects above the threshold are downloaded as parallel 8 MiB range GETs
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+META_CONCURRENCY = 200
+
 
 class AsyncS3Client:
-    def __init__(self, bucketname: str | None, max_concurency: int = 5, **session_params: Mapping[str, Any]) -> None:
-        self._session = aioboto3.Session()
+    # slot access is cheaper than a dict lookup, and the bucket check
+    # decorator reads _selected_bucket on every public call
+    __slots__ = (
+        "_session",
+        "_session_params",
+        "_selected_bucket",
+        "_max_concurrency",
+        "_semaphore",
+        "_chunk_semaphore",
+        "_meta_semaphore",
+        "_client",
+        "_client_cm",
+        "_client_lock",
+    )
+
+    def __init__(self, bucketname: str | None, max_concurrency: int = 5, **session_params: Mapping[str, Any]) -> None:
+        self._session = _SESSION
+        # the default botocore pool of 10 connections would silently cap
+        # concurrency below the requested limit
+        session_params.setdefault(
+            "config",
+            Config(
+                max_pool_connections=max(max_concurrency, 50),
+                tcp_keepalive=True,
+                retries={"mode": "adaptive", "max_attempts": 10},
+            ),
+        )
         self._session_params = session_params
         self._selected_bucket = bucketname
-        self._semaphore = asyncio.Semaphore(5)
+        self._max_concurrency = max_concurrency
+        # semaphores are created lazily inside a coroutine so they bind to
+        # the loop that actually runs the requests, not whatever loop
+        # (if any) was current during __init__
+        self._semaphore = None
+        self._chunk_semaphore = None
+        self._meta_semaphore = None
+        self._client = None
+        self._client_cm = None
+        self._client_lock = asyncio.Lock()
+
+    def _sem(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    def _chunk_sem(self) -> asyncio.Semaphore:
+        # separate cap for byte-range chunks so chunk parallelism
+        # doesn't starve bucket-level operations
+        if self._chunk_semaphore is None:
+            self._chunk_semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._chunk_semaphore
+
+    def _meta_sem(self) -> asyncio.Semaphore:
+        # metadata ops (copy, delete, presign, existence checks) are cheap,
+        # gating them behind the transfer semaphore would serialize them
+        # against uploads/downloads for no reason
+        if self._meta_semaphore is None:
+            self._meta_semaphore = asyncio.Semaphore(META_CONCURRENCY)
+        return self._meta_semaphore
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._client.close()
+        if self._client_cm is not None:
+            await self._client_cm.__aexit__(exc_type, exc_val, exc_tb)
+            self._client = None
+            self._client_cm = None
 
-    @asynccontextmanager
-    # ? #couldnt find the right client class, docs does not provide such
-    async def get_client(self) -> AsyncGenerator:
-        async with self._session.client("s3", **self._session_params) as client:
-            yield client
+    async def _ensure_client(self):
+        """
+        Lazily opens a single S3 client and caches it, so every operation
+        shares one connection pool instead of paying TLS handshake and
+        credential resolution per call.
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client_cm = self._session.client("s3", **self._session_params)
+                    self._client = await self._client_cm.__aenter__()
+        return self._client
 
     @property
     def selected_bucket(self) -> str:
@@ -32,74 +108,141 @@ class AsyncS3Client:
 
     @selected_bucket.setter
     async def set_selected_bucket(self, bucketname: str) -> None:
-        if bucketname not in await self.ls_buckets():
+        if not await self._bucket_exists(bucketname):
             raise Exception(f"Bucket named {bucketname} is unavailable")
 
         self._selected_bucket = bucketname
 
+    async def _bucket_exists(self, bucketname: str) -> bool:
+        # single HEAD instead of listing every bucket in the account
+        client = await self._ensure_client()
+        try:
+            await client.head_bucket(Bucket=bucketname)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return False
+            raise
+
     @check_bucket_selected
     async def ls_buckets(self) -> list[str]:
-        async with self.get_client() as client:
-            response = await client.list_buckets()
-            return [bucket["Name"] for bucket in response["Buckets"]]
+        client = await self._ensure_client()
+        response = await client.list_buckets()
+        return [bucket["Name"] for bucket in response["Buckets"]]
 
     @check_bucket_selected
     async def create_bucket(self, bucketname: str) -> None:
-        if bucketname not in await self.ls_buckets():
-            async with self.get_client() as client:
-                await client.create_bucket(Bucket=bucketname)
+        if not await self._bucket_exists(bucketname):
+            client = await self._ensure_client()
+            await client.create_bucket(Bucket=bucketname)
 
     @check_bucket_selected
     async def upload_file(self, file_path: str, key: str | None = None, overwrite: bool = False, **kwargs) -> None:
-        async with self._semaphore:
+        async with self._sem():
             if key is None:
                 key = Path(file_path).name
 
-            if not overwrite and await self.check_exist(key):
-                raise FileExistsError(f"You are trying to overwrite {key}. Use overwrite=True flag if intended")
+            client = await self._ensure_client()
+            if overwrite:
+                with open(file_path, "rb") as body:
+                    await self._put_stream(client, body, key, **kwargs)
+                return
+            # conditional PUT: S3 rejects the write with 412 when the key
+            # already exists, so there is no pre-check round trip and no
+            # check-then-upload race. The transfer manager does not accept
+            # IfNoneMatch, but the plain PutObject shape supports it, so
+            # the default path goes through put_object directly
+            try:
+                with open(file_path, "rb") as body:
+                    await client.put_object(Bucket=self._selected_bucket, Key=key, Body=body, IfNoneMatch="*", **kwargs)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "PreconditionFailed":
+                    raise FileExistsError(f"You are trying to overwrite {key}. Use overwrite=True flag if intended")
+                raise
+
+    @staticmethod
+    async def _read_chunk(stream: BinaryIO, size: int) -> bytes:
+        # streams may be sync (BytesIO, open files) or async (aiofiles);
+        # only the latter return an awaitable from read
+        data = stream.read(size)
+        if inspect.isawaitable(data):
+            data = await data
+        return data
+
+    async def _put_stream(self, client, stream: BinaryIO, key: str, **kwargs) -> None:
+        """
+        Uploads a stream with a hand-rolled multipart loop, one
+        MULTIPART_CHUNK_SIZE buffer in memory at a time. Streams that fit
+        in a single chunk go through one put_object instead.
+        """
+        chunk = await self._read_chunk(stream, MULTIPART_CHUNK_SIZE)
+        if len(chunk) < MULTIPART_CHUNK_SIZE:
+            await client.put_object(Bucket=self._selected_bucket, Key=key, Body=chunk, **kwargs)
+            return
 
-            async with self.get_client() as client:
-                await client.upload_file(Bucket=self._selected_bucket, Filename=file_path, Key=key, **kwargs)
+        multipart = await client.create_multipart_upload(Bucket=self._selected_bucket, Key=key, **kwargs)
+        upload_id = multipart["UploadId"]
+        try:
+            parts = []
+            part_number = 1
+            while chunk:
+                response = await client.upload_part(
+                    Bucket=self._selected_bucket,
+                    Key=key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=chunk,
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                part_number += 1
+                chunk = await self._read_chunk(stream, MULTIPART_CHUNK_SIZE)
+            await client.complete_multipart_upload(
+                Bucket=self._selected_bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            # without the abort the partial parts linger (and are billed)
+            # until a lifecycle rule reaps them
+            await client.abort_multipart_upload(Bucket=self._selected_bucket, Key=key, UploadId=upload_id)
+            raise
 
     @check_bucket_selected
     async def upload_stream(self, stream: BinaryIO, key: str, **kwargs) -> None:
         """
-        Uploads a binary stream to S3.
+        Uploads a binary stream to S3 as a multipart upload,
+        so the object is never buffered whole in memory.
 
         :param stream: Binary stream to upload.
         :param key: S3 key name.
-        :param kwargs: Additional arguments passed to put_object().
+        :param kwargs: Additional arguments passed to put_object() /
+            create_multipart_upload().
         """
         try:
-            async with self._semaphore:
-                data = await stream.read()
-                async with self.get_client() as client:
-                    await client.put_object(Bucket=self._selected_bucket, Key=key, Body=data, **kwargs)
-        except Exception as e:
-            await stream.seek(0)
-            raise e
+            async with self._sem():
+                client = await self._ensure_client()
+                await self._put_stream(client, stream, key, **kwargs)
+        except Exception:
+            # sync and async streams both pass through here, and only the
+            # latter return an awaitable from seek
+            rewind = stream.seek(0)
+            if inspect.isawaitable(rewind):
+                await rewind
+            raise
 
     @check_bucket_selected
-    async def ls_files_paged(self, prefix: str, page_len: int = 100) -> AsyncGenerator[dict[str, Any], None]:
-        async with self.get_client() as client:
-            continuation_token = None
-            while True:
-                list_kwargs = {
-                    "Bucket": self._selected_bucket,
-                    "Prefix": prefix,
-                    "MaxKeys": page_len,
-                }
-                if continuation_token:
-                    list_kwargs["ContinuationToken"] = continuation_token
-
-                response = await client.list_objects_v2(**list_kwargs)
-                contents = response.get("Contents", [])
-                if contents:
-                    yield contents
-
-                if not response.get("IsTruncated"):
-                    break
-                continuation_token = response.get("NextContinuationToken")
+    async def ls_files_paged(self, prefix: str, page_len: int = 1000) -> AsyncGenerator[dict[str, Any], None]:
+        client = await self._ensure_client()
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=self._selected_bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": page_len},
+        ):
+            contents = page.get("Contents", [])
+            if contents:
+                yield contents
 
     @check_bucket_selected
     async def ls_files(self, prefix: str = "") -> AsyncGenerator[dict[str, Any], None]:
@@ -126,68 +269,108 @@ class AsyncS3Client:
         destination = Path(destination)
         destination.mkdir(parents=True, exist_ok=True)
 
-        tasks_data: list[tuple[str, Path]] = []
-
-        async with self.get_client() as client:
-            async for obj in self.ls_files(prefix):
-                key = obj["Key"]
-                relative_path = Path(key).relative_to(prefix) if prefix and key != prefix else Path(key).name
-                local_path = destination / relative_path
-
-                if local_path.exists() and not overwrite:
-                    tasks_data.append((key, local_path, FileExistsError(f"{local_path} already exists and overwrite is False")))
-                else:
-                    local_path.parent.mkdir(parents=True, exist_ok=True)
-                    tasks_data.append((key, local_path, None))
+        tasks_data: list[tuple[str, Path, int, Exception | None]] = []
 
-            async def download_file(key: str, path: Path, precheck_error: Exception | None):
-                if precheck_error is not None:
-                    return str(path), precheck_error
-
-                async with self._semaphore:
-                    try:
+        client = await self._ensure_client()
+        async for obj in self.ls_files(prefix):
+            key = obj["Key"]
+            relative_path = Path(key).relative_to(prefix) if prefix and key != prefix else Path(key).name
+            local_path = destination / relative_path
+
+            if local_path.exists() and not overwrite:
+                tasks_data.append((key, local_path, obj["Size"], FileExistsError(f"{local_path} already exists and overwrite is False")))
+            else:
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                tasks_data.append((key, local_path, obj["Size"], None))
+
+        async def download_ranged(key: str, path: Path, size: int):
+            # large objects are fetched as parallel range GETs written
+            # via pwrite, so chunks can land in any order
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+            try:
+                os.truncate(fd, size)
+
+                async def fetch_range(start: int):
+                    end = min(start + MULTIPART_CHUNK_SIZE - 1, size - 1)
+                    async with self._chunk_sem():
+                        response = await client.get_object(Bucket=self._selected_bucket, Key=key, Range=f"bytes={start}-{end}")
+                        data = await response["Body"].read()
+                    await asyncio.to_thread(os.pwrite, fd, data, start)
+
+                await asyncio.gather(*(fetch_range(start) for start in range(0, size, MULTIPART_CHUNK_SIZE)))
+            finally:
+                os.close(fd)
+
+        async def download_file(key: str, path: Path, size: int, precheck_error: Exception | None):
+            if precheck_error is not None:
+                return str(path), precheck_error
+
+            async with self._sem():
+                try:
+                    if size > MULTIPART_THRESHOLD:
+                        await download_ranged(key, path, size)
+                    else:
                         await client.download_file(
                             Bucket=self._selected_bucket,
                             Key=key,
                             Filename=str(path),
                         )
-                        return str(path), None
-                    except Exception as e:
-                        return str(path), e
+                    return str(path), None
+                except Exception as e:
+                    return str(path), e
 
-            tasks = [asyncio.create_task(download_file(key, path, error)) for key, path, error in tasks_data]
-            return await asyncio.gather(*tasks)
+        tasks = [asyncio.create_task(download_file(key, path, size, error)) for key, path, size, error in tasks_data]
+        return await asyncio.gather(*tasks)
 
     # ? This one was tricky. Still not sure if implemented right, and if I should have used as_completed here.
     # ? It may be usefull in some cases, but usualy you would work with chunks coherently, so I stick to gather
-    async def download_by_chunks(self, key: str, chunk_size: int = 1024 * 1024) -> AsyncGenerator[bytes, None]:
-        async with self.get_client() as client:
-            head_response = await client.head_object(Bucket=self._selected_bucket, Key=key)
-            total_size = int(head_response["ContentLength"])
-            num_chunks = (total_size + chunk_size - 1) // chunk_size
-
-            async def download_chunk(index: int):
-                async with self._semaphore:
-                    start_range = index * chunk_size
-                    end_range = min(start_range + chunk_size - 1, total_size - 1)
-                    range_header = f"bytes={start_range}-{end_range}"
-                    response = await client.get_object(Bucket=self._selected_bucket, Key=key, Range=range_header)
-                    data = await response["Body"].read()
-                    return index, data
-
-            tasks = [asyncio.create_task(download_chunk(i) for i in range(num_chunks))]
-
-            # ? chunks = [None] * num_chunks
-            # ? for future in asyncio.as_completed(*tasks):
-            # ?     try:
-            # ?         index, data = await future
-            # ?         chunks[index] = data
-            # ?     except Exception as e:
-            # ?         raise e
-
-            chunks = await asyncio.gather(*tasks)
-            for chunk in chunks:
-                yield chunk
+    async def download_by_chunks(self, key: str, chunk_size: int = 8 * 1024 * 1024, parallel: bool = False) -> AsyncGenerator[bytes, None]:
+        """
+        Downloads a file in chunks (async generator).
+
+        The chunks are contiguous by construction, so by default the whole
+        object is fetched with one GET and the body is streamed in
+        chunk_size reads — N-1 fewer requests than a range GET per chunk.
+        Set parallel=True to fetch the ranges concurrently instead, which
+        pays off for large objects when chunk_size amortizes request cost.
+
+        :param key: S3 key.
+        :param chunk_size: Chunk size in bytes.
+        :param parallel: Fetch ranges concurrently instead of streaming one GET.
+        :yield: File content in chunks, in order.
+        """
+        client = await self._ensure_client()
+
+        if not parallel:
+            response = await client.get_object(Bucket=self._selected_bucket, Key=key)
+            body = response["Body"]
+            while True:
+                data = await body.read(chunk_size)
+                if not data:
+                    return
+                yield data
+            return
+
+        head_response = await client.head_object(Bucket=self._selected_bucket, Key=key)
+        total_size = int(head_response["ContentLength"])
+        num_chunks = (total_size + chunk_size - 1) // chunk_size
+
+        async def download_chunk(index: int):
+            async with self._chunk_sem():
+                start_range = index * chunk_size
+                end_range = min(start_range + chunk_size - 1, total_size - 1)
+                range_header = f"bytes={start_range}-{end_range}"
+                response = await client.get_object(Bucket=self._selected_bucket, Key=key, Range=range_header)
+                data = await response["Body"].read()
+                return index, data
+
+        tasks = [asyncio.create_task(download_chunk(i)) for i in range(num_chunks)]
+
+        # chunks arrive indexed so the caller always sees them in order,
+        # no matter which range finished first
+        chunks = await asyncio.gather(*tasks)
+        for _, data in sorted(chunks):
+            yield data
 
     @check_bucket_selected
     async def copy(self, prefix: str, destination_prefix: str, overwrite: bool = False) -> list[tuple[str, Exception | None]]:
@@ -197,28 +380,62 @@ class AsyncS3Client:
         :param destination_prefix: New prefix.
         :param overwrite: File will be skipped if already exists in destination. Set True to overwrite them.
         """
-        async with self.get_client() as client:
-
-            async def copy_task(source_key, destination_key, overwrite):
-                result = None
-                async with self._semaphore:
-                    try:
-                        if not await self.check_exist(destination_key) or overwrite:
-                            copy_source = {"Bucket": self._selected_bucket, "Key": source_key}
-                            await client.copy_object(Bucket=self._selected_bucket, CopySource=copy_source, Key=destination_key)
-                        else:
-                            result = FileExistsError(f"You are trying to overwrite {destination_key}. Use overwrite=True flag if intended")
-                    except Exception as e:
-                        result = e
-                    finally:
-                        return (destination_key, result)
-
-            tasks = []
+        client = await self._ensure_client()
+        # one listing of the destination instead of an existence check per key
+        dest_existing = set() if overwrite else {obj["Key"] async for obj in self.ls_files(destination_prefix)}
+
+        async def copy_task(source_key, destination_key, overwrite):
+            result = None
+            async with self._meta_sem():
+                try:
+                    if destination_key not in dest_existing or overwrite:
+                        copy_source = {"Bucket": self._selected_bucket, "Key": source_key}
+                        await client.copy_object(Bucket=self._selected_bucket, CopySource=copy_source, Key=destination_key)
+                    else:
+                        result = FileExistsError(f"You are trying to overwrite {destination_key}. Use overwrite=True flag if intended")
+                except Exception as e:
+                    result = e
+                # not a finally: returning from one would swallow the
+                # CancelledError the cleanup below relies on
+                return (destination_key, result)
+
+        # bounded producer/consumer pipeline: keys are consumed as the
+        # listing streams in, so in-flight work stays O(concurrency)
+        # instead of materializing a task per object upfront
+        queue: asyncio.Queue = asyncio.Queue(maxsize=META_CONCURRENCY * 2)
+        results: list[tuple[str, Exception | None]] = []
+        workers: list[asyncio.Task] = []
+        prefix_len = len(prefix)
+
+        async def producer():
             async for obj in self.ls_files(prefix):
-                source_key = obj["Key"]
-                destination_key = source_key.replace(prefix, destination_prefix, 1)
-                tasks.append(asyncio.create_task(copy_task(source_key, destination_key, overwrite)))
-            return await asyncio.gather(*tasks)
+                await queue.put(obj["Key"])
+                # the pool grows with the workload, so a copy of a handful
+                # of keys spawns a handful of workers, not META_CONCURRENCY
+                if len(workers) < META_CONCURRENCY:
+                    workers.append(asyncio.create_task(worker()))
+            for _ in range(len(workers)):
+                await queue.put(None)
+
+        async def worker():
+            while True:
+                source_key = await queue.get()
+                if source_key is None:
+                    return
+                destination_key = destination_prefix + source_key[prefix_len:]
+                results.append(await copy_task(source_key, destination_key, overwrite))
+
+        # if the producer fails (e.g. the listing errors out), the workers
+        # never see their sentinels — cancel them instead of leaking tasks
+        # blocked on queue.get() forever
+        try:
+            await producer()
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return results
 
     @check_bucket_selected
     async def move(self, prefix: str, new_prefix: str, overwrite: bool = False) -> list[tuple[str, Exception | None]]:
@@ -228,48 +445,97 @@ class AsyncS3Client:
         :param new_prefix: New prefix.
         :param overwrite: File will be skipped if already exists in destination. Set True to overwrite it.
         """
-        async with self.get_client() as client:
-
-            async def move_task(source_key, destination_key):
-                result = None
-                async with self._semaphore:
-                    try:
-                        if overwrite or not await self.check_exist(destination_key):
-                            copy_source = {"Bucket": self._selected_bucket, "Key": source_key}
-                            # could use self.copy instead
-                            await client.copy_object(Bucket=self._selected_bucket, CopySource=copy_source, Key=destination_key)
-                        else:
-                            result = FileExistsError(f"{destination_key} exists. Use overwrite=True to replace.")
-                    except Exception as e:
-                        result = e
-                    return destination_key, result
-
-            tasks = []
-            original_keys = [obj["Key"] async for obj in self.ls_files(prefix)]
-
-            for key in original_keys:
-                dest_key = key.replace(prefix, new_prefix, 1)
-                tasks.append(move_task(key, dest_key))
-
-            results = await asyncio.gather(*tasks)
-
-            for i in range(0, len(original_keys), 1000):
-                chunk = original_keys[i : i + 1000]
-                async with self.get_client() as client:
-                    await client.delete_objects(Bucket=self._selected_bucket, Delete={"Objects": [{"Key": k} for k in chunk]})
-
-            return results
+        client = await self._ensure_client()
+        # one listing of the destination instead of an existence check per key
+        dest_existing = set() if overwrite else {obj["Key"] async for obj in self.ls_files(new_prefix)}
+
+        async def move_task(source_key, destination_key):
+            result = None
+            async with self._meta_sem():
+                try:
+                    if overwrite or destination_key not in dest_existing:
+                        copy_source = {"Bucket": self._selected_bucket, "Key": source_key}
+                        # could use self.copy instead
+                        await client.copy_object(Bucket=self._selected_bucket, CopySource=copy_source, Key=destination_key)
+                    else:
+                        result = FileExistsError(f"{destination_key} exists. Use overwrite=True to replace.")
+                except Exception as e:
+                    result = e
+                return destination_key, result
+
+        async def delete_chunk(keys):
+            async with self._meta_sem():
+                await client.delete_objects(Bucket=self._selected_bucket, Delete={"Objects": [{"Key": k} for k in keys]})
+
+        # listing, copying and deleting are fused page by page: each listed
+        # page is copied with gather, and source keys whose copy succeeded
+        # are deleted in 1000-key batches while later pages still stream in.
+        # Memory stays O(page size) and deletes overlap the remaining copies.
+        results: list[tuple[str, Exception | None]] = []
+        pending_delete: list[str] = []
+        prefix_len = len(prefix)
+
+        async for page in self.ls_files_paged(prefix):
+            page_keys = [obj["Key"] for obj in page]
+            tasks = [asyncio.create_task(move_task(key, new_prefix + key[prefix_len:])) for key in page_keys]
+            page_results = await asyncio.gather(*tasks)
+            results.extend(page_results)
+            pending_delete.extend(key for key, (_, error) in zip(page_keys, page_results) if error is None)
+
+            while len(pending_delete) >= 1000:
+                chunk = pending_delete[:1000]
+                del pending_delete[:1000]
+                await delete_chunk(chunk)
+
+        if pending_delete:
+            await delete_chunk(pending_delete)
+
+        return results
 
     @check_bucket_selected
-    async def check_exist(self, prefix: str) -> bool:
+    async def check_key_exist(self, key: str) -> bool:
+        """
+        Checks if an exact key exists via a single head_object,
+        which is much cheaper than listing.
+
+        :param key: Full key to check.
+        :return: True if the key exists.
+        """
+        client = await self._ensure_client()
+        async with self._meta_sem():
+            try:
+                await client.head_object(Bucket=self._selected_bucket, Key=key)
+                return True
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "404":
+                    return False
+                raise
+
+    @check_bucket_selected
+    async def check_prefix_exist(self, prefix: str) -> bool:
         """
         Checks if any file exists under a prefix.
 
         :param prefix: Prefix to check.
         :return: True if any file exists.
         """
-        pages = self.ls_files_paged(prefix)
-        return bool(await anext(pages, None))
+        async with self._meta_sem():
+            pages = self.ls_files_paged(prefix)
+            return bool(await anext(pages, None))
+
+    @check_bucket_selected
+    async def check_exist(self, prefix: str) -> bool:
+        """
+        Checks if any file exists under a prefix.
+        Tries the cheap head_object path first for the common case
+        where the prefix is actually a full key.
+
+        :param prefix: Key or prefix to check.
+        :return: True if any file exists.
+        """
+        if await self.check_key_exist(prefix):
+            return True
+        return await self.check_prefix_exist(prefix)
 
     @check_bucket_selected
     async def remove(self, prefix: str) -> None:
@@ -277,17 +543,23 @@ class AsyncS3Client:
         Deletes files under a given prefix.
         :param prefix: Prefix to delete.
         """
-        keys_to_delete = [{"Key": obj["Key"]} async for obj in self.ls_files(prefix)]
+        client = await self._ensure_client()
 
         async def delete_chunk(chunk):
-            async with self._semaphore:
-                async with self.get_client() as client:
-                    await client.delete_objects(Bucket=self._selected_bucket, Delete={"Objects": chunk})
+            async with self._meta_sem():
+                await client.delete_objects(Bucket=self._selected_bucket, Delete={"Objects": chunk})
 
+        # batches are flushed while the listing is still streaming, so at
+        # most 1000 keys are buffered at a time (the delete_objects max)
         tasks = []
-        for i in range(0, len(keys_to_delete), 1000):
-            chunk = keys_to_delete[i : i + 1000]
-            tasks.append(delete_chunk(chunk))
+        batch = []
+        async for obj in self.ls_files(prefix):
+            batch.append({"Key": obj["Key"]})
+            if len(batch) == 1000:
+                tasks.append(asyncio.create_task(delete_chunk(batch)))
+                batch = []
+        if batch:
+            tasks.append(asyncio.create_task(delete_chunk(batch)))
 
         await asyncio.gather(*tasks)
 
@@ -300,23 +572,19 @@ class AsyncS3Client:
         :return: Dictionary of key to URL.
         """
 
-        async def url_task(key):
-            async with self._semaphore:
-                async with self.get_client() as client:
-                    url = await client.generate_presigned_url(
-                        "get_object",
-                        Params={"Bucket": self._selected_bucket, "Key": key},
-                        ExpiresIn=expires_in,
-                    )
-                return key, url
-
-        tasks = []
-        async for obj in self.ls_files(prefix):
-            key = obj["Key"]
-            tasks.append(url_task(key))
-
-        results = await asyncio.gather(*tasks)
-        return dict(results)
+        client = await self._ensure_client()
+        urls = {}
+        # presigning is pure local HMAC work, no request leaves the process,
+        # so per-key tasks and semaphores would only add scheduling overhead
+        async for page in self.ls_files_paged(prefix):
+            for obj in page:
+                key = obj["Key"]
+                urls[key] = await client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": self._selected_bucket, "Key": key},
+                    ExpiresIn=expires_in,
+                )
+        return urls
 
     @check_bucket_selected
     async def count_files(self, prefix: str) -> int:
@@ -326,7 +594,10 @@ class AsyncS3Client:
         :param prefix: Prefix to count.
         :return: Total number of files.
         """
-        return sum([1 async for _ in self.ls_files(prefix)])
+        count = 0
+        async for page in self.ls_files_paged(prefix):
+            count += len(page)
+        return count
 
     @check_bucket_selected
     async def get_sizes(self, prefix: str) -> dict[str, int]:
@@ -336,4 +607,7 @@ class AsyncS3Client:
         :param prefix: Prefix to check.
         :return: Dictionary of key to size in bytes.
         """
-        return {f["Key"]: f["Size"] async for f in self.ls_files(prefix)}
+        sizes = {}
+        async for page in self.ls_files_paged(prefix):
+            sizes.update((obj["Key"], obj["Size"]) for obj in page)
+        return sizes
@@ -1,4 +1,6 @@
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from botowrapper.helpers import check_bucket_selected
 from typing import BinaryIO, Any
 from pathlib import Path
@@ -9,6 +11,10 @@ from typing import Iterable
 class SyncS3Client:
     """Handles managing files in S3"""
 
+    # slot access is cheaper than a dict lookup, and the bucket check
+    # decorator reads _selected_bucket on every public call
+    __slots__ = ("_client", "_selected_bucket")
+
     def __init__(self, bucketname: str = None, **session_params: dict[str, Any]) -> Any:
         """
         Initializes the S3 client wrapper.
@@ -25,6 +31,16 @@ class SyncS3Client:
                     verify=False
                 }
         """
+        # the default botocore pool of 10 connections would silently cap
+        # concurrency when the client is shared between threads
+        session_params.setdefault(
+            "config",
+            Config(
+                max_pool_connections=50,
+                tcp_keepalive=True,
+                retries={"mode": "adaptive", "max_attempts": 10},
+            ),
+        )
         self._client = boto3.client(service_name="s3", **session_params)
         self.create_bucket(bucketname)
         self._selected_bucket = bucketname
@@ -43,9 +59,19 @@ class SyncS3Client:
 
         :param bucketname: Bucket to be created name
         """
-        if bucketname not in self.ls_buckets():
+        if not self._bucket_exists(bucketname):
             self._client.create_bucket(Bucket=bucketname)
 
+    def _bucket_exists(self, bucketname: str) -> bool:
+        # single HEAD instead of listing every bucket in the account
+        try:
+            self._client.head_bucket(Bucket=bucketname)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return False
+            raise
+
     @property
     def selected_bucket(self) -> str | None:
         """
@@ -62,8 +88,7 @@ class SyncS3Client:
 
         :param bucketname: Name of the bucket.
         """
-        available_buckets = self._client.get_buckets()
-        if bucketname not in available_buckets:
+        if not self._bucket_exists(bucketname):
             raise Exception(f"Bucket named {bucketname} is unavailable")
         self._selected_bucket = bucketname
 
@@ -74,15 +99,28 @@ class SyncS3Client:
 
         :param file_path: Path to the local file.
         :param key: S3 key name. If not specified, uses file name.
-        :param kwargs: Additional arguments passed to upload_file().
+        :param kwargs: Additional arguments passed to the underlying call:
+            upload_file() when overwrite=True, put_object() otherwise.
         :param overwrite: Safety flag to prevent unintended overwrites.
         :return: True if upload succeeds.
         """
         if key is None:
             key = Path(file_path).name
-        if self.check_exist(key) and not overwrite:
-            raise FileExistsError(f"You are trying to overwrite {key}. Use overwrite=True flag if intended")
-        self._client.upload_file(Bucket=self._selected_bucket, Filename=file_path, Key=key, **kwargs)
+        if overwrite:
+            self._client.upload_file(Bucket=self._selected_bucket, Filename=file_path, Key=key, **kwargs)
+            return
+        # conditional PUT: S3 rejects the write with 412 when the key
+        # already exists, so there is no pre-check round trip and no
+        # check-then-upload race. s3transfer does not accept IfNoneMatch
+        # as an ExtraArgs key, but the plain PutObject shape supports it,
+        # so the default path goes through put_object directly
+        try:
+            with open(file_path, "rb") as body:
+                self._client.put_object(Bucket=self._selected_bucket, Key=key, Body=body, IfNoneMatch="*", **kwargs)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "PreconditionFailed":
+                raise FileExistsError(f"You are trying to overwrite {key}. Use overwrite=True flag if intended")
+            raise
 
     @check_bucket_selected
     def upload_stream(self, stream: BinaryIO, key: str, **kwargs) -> None:
@@ -97,7 +135,7 @@ class SyncS3Client:
         self._client.put_object(Bucket=self._selected_bucket, Key=key, Body=stream, **kwargs)
 
     @check_bucket_selected
-    def ls_files_paged(self, prefix: str, page_len: int = 100) -> Iterable:
+    def ls_files_paged(self, prefix: str, page_len: int = 1000) -> Iterable:
         """
         Lists files under a prefix with pagination.
 
@@ -122,7 +160,7 @@ class SyncS3Client:
         :param prefix: Prefix to search under.
         :yield: File object metadata.
         """
-        pages = self.ls_files_paged(prefix, 100)
+        pages = self.ls_files_paged(prefix)
         for page in pages:
             for obj in page:
                 yield obj
@@ -178,10 +216,15 @@ class SyncS3Client:
         :param destination_prefix: New prefix.
         :param overwrite: File will be skipped if already exists in destination. Set True to overwrite them.
         """
+        # one listing of the destination instead of an existence check per key
+        dest_existing = set() if overwrite else {obj["Key"] for obj in self.ls_files(destination_prefix)}
+        # keys are guaranteed to start with prefix, so a slice is enough and,
+        # unlike replace, cannot rewrite a mid-key occurrence of the prefix
+        prefix_len = len(prefix)
         for obj in self.ls_files(prefix):
             source_key = obj["Key"]
-            destination_key = source_key.replace(prefix, destination_prefix, 1)
-            if not self.check_exist(destination_key) or overwrite:
+            destination_key = destination_prefix + source_key[prefix_len:]
+            if destination_key not in dest_existing or overwrite:
                 copy_source = {"Bucket": self._selected_bucket, "Key": source_key}
                 self._client.copy_object(Bucket=self._selected_bucket, CopySource=copy_source, Key=destination_key)
 
@@ -195,10 +238,13 @@ class SyncS3Client:
         :param overwrite: File will be skipped if already exists in destination. Set True to overwrite it.
         """
         original_keys = [obj["Key"] for obj in self.ls_files(prefix)]
+        # one listing of the destination instead of an existence check per key
+        dest_existing = set() if overwrite else {obj["Key"] for obj in self.ls_files(new_prefix)}
 
+        prefix_len = len(prefix)
         for key in original_keys:
-            dest_key = key.replace(prefix, new_prefix, 1)
-            if not self.check_exist(dest_key) or overwrite:
+            dest_key = new_prefix + key[prefix_len:]
+            if dest_key not in dest_existing or overwrite:
                 copy_source = {"Bucket": self._selected_bucket, "Key": key}
                 self._client.copy_object(Bucket=self._selected_bucket, CopySource=copy_source, Key=dest_key)
 
@@ -221,7 +267,24 @@ class SyncS3Client:
             self._client.delete_objects(Bucket=self._selected_bucket, Delete={"Objects": chunk})
 
     @check_bucket_selected
-    def check_exist(self, prefix: str) -> bool:
+    def check_key_exist(self, key: str) -> bool:
+        """
+        Checks if an exact key exists via a single head_object,
+        which is much cheaper than listing.
+
+        :param key: Full key to check.
+        :return: True if the key exists.
+        """
+        try:
+            self._client.head_object(Bucket=self._selected_bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return False
+            raise
+
+    @check_bucket_selected
+    def check_prefix_exist(self, prefix: str) -> bool:
         """
         Checks if any file exists under a prefix.
 
@@ -231,6 +294,20 @@ class SyncS3Client:
         pages = self.ls_files_paged(prefix)
         return bool(next(pages, None))
 
+    @check_bucket_selected
+    def check_exist(self, prefix: str) -> bool:
+        """
+        Checks if any file exists under a prefix.
+        Tries the cheap head_object path first for the common case
+        where the prefix is actually a full key.
+
+        :param prefix: Key or prefix to check.
+        :return: True if any file exists.
+        """
+        if self.check_key_exist(prefix):
+            return True
+        return self.check_prefix_exist(prefix)
+
     @check_bucket_selected
     def count_files(self, prefix: str) -> int:
         """
@@ -239,7 +316,7 @@ class SyncS3Client:
         :param prefix: Prefix to count.
         :return: Total number of files.
         """
-        return sum(1 for _ in self.ls_files(prefix))
+        return sum(len(page) for page in self.ls_files_paged(prefix))
 
     @check_bucket_selected
     def get_sizes(self, prefix: str) -> dict[str, int]:
@@ -249,7 +326,10 @@ class SyncS3Client:
         :param prefix: Prefix to check.
         :return: Dictionary of key to size in bytes.
         """
-        return {f["Key"]: f["Size"] for f in self.ls_files(prefix)}
+        sizes = {}
+        for page in self.ls_files_paged(prefix):
+            sizes.update((obj["Key"], obj["Size"]) for obj in page)
+        return sizes
 
     @check_bucket_selected
     def get_urls(self, prefix: str, expires_in: int = 3600) -> dict[str, str]:
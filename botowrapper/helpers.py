@@ -2,7 +2,7 @@ from functools import wraps
 
 
 class BucketIsNotSelectedException(Exception):
-    def __init__(self, message: str | None):
+    def __init__(self, message: str | None = None):
         if not message:
             message = "Bucket is not selected. Use select_bucket() beforehead"
         super().__init__(message)
@@ -0,0 +1,79 @@
+import atexit
+import configparser
+import os
+from pathlib import Path
+from shutil import rmtree
+
+from botocore.config import Config
+
+from tests._minio_fixture import get_container
+
+
+def _count(path) -> int:
+    # scandir avoids building a Path object per entry just to count them
+    return sum(1 for _ in os.scandir(path))
+
+
+# parsed once at import so class setup doesn't redo file IO + parsing
+_CFG = configparser.ConfigParser()
+_CFG.read(Path(__file__).parent / ".cfg")
+_MINIO = dict(_CFG["minio"])
+
+# pool sized to the 100-file fan-out so parallel uploads don't churn
+# connections ("Connection pool is full" spam + re-handshakes)
+_BOTO_CFG = Config(max_pool_connections=50, retries={"mode": "standard", "max_attempts": 3})
+
+
+class MinIOBackedTestBase:
+    """
+    Shared MinIO bootstrap for the sync and async suites.
+
+    Container, credentials and the 100 deterministic fixture files are
+    set up once per process: whichever subclass reaches setUpClass first
+    pays the cost, the other reuses everything. The fixture directories
+    are removed by an atexit hook, alongside the container itself.
+    """
+
+    _booted = False
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if MinIOBackedTestBase._booted:
+            return
+        MinIOBackedTestBase._booted = True
+
+        # fail on a broken config before paying for the docker socket
+        # probe and image lookup
+        missing = [k for k in ("access_key", "secret_key", "bucket_name", "host", "endpoint_port", "console_port") if not _MINIO.get(k)]
+        if missing:
+            raise RuntimeError(f"tests/.cfg [minio] is missing: {', '.join(missing)}")
+
+        base = MinIOBackedTestBase
+        base.access_key = _MINIO["access_key"]
+        base.secret_key = _MINIO["secret_key"]
+        base.bucket_name = _MINIO["bucket_name"]
+        base.host = _MINIO["host"]
+        base.endpoint_port = _MINIO["endpoint_port"]
+        base.console_port = _MINIO["console_port"]
+
+        # CI setups that bring their own MinIO set USE_EXTERNAL_MINIO;
+        # docker is then never touched at all
+        if os.environ.get("USE_EXTERNAL_MINIO"):
+            base.container = None
+        else:
+            base.container = get_container(base.access_key, base.secret_key, base.host, base.endpoint_port, base.console_port)
+
+        base.testfiles = Path(__file__).parent / "testfiles"
+        base.testdownloaded = Path(__file__).parent / "testdownloaded"
+        base.testfiles.mkdir(parents=True, exist_ok=True)
+        base.testdownloaded.mkdir(parents=True, exist_ok=True)
+        for i in range(100):
+            (base.testfiles / f"test{i}.txt").write_bytes(f"Test file {i}".encode())
+
+        atexit.register(_cleanup_dirs)
+
+
+def _cleanup_dirs() -> None:
+    rmtree(MinIOBackedTestBase.testfiles, ignore_errors=True)
+    rmtree(MinIOBackedTestBase.testdownloaded, ignore_errors=True)
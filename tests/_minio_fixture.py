@@ -0,0 +1,80 @@
+import atexit
+import socket
+import time
+import urllib.request
+
+_container = None
+_docker_client = None
+
+
+def get_container(access_key: str, secret_key: str, host: str, endpoint_port: str, console_port: str):
+    """
+    Starts (or reuses) a single MinIO container for the whole test run.
+
+    The first caller pays the boot cost, every later call returns the same
+    container, and an atexit hook tears it down when the process exits.
+    Readiness is detected by polling the health endpoint instead of a
+    fixed sleep.
+    """
+    global _container, _docker_client
+    if _container is not None:
+        return _container
+
+    # imported here so runs against an external MinIO never pay for (or
+    # even need) the docker package
+    import docker
+
+    _docker_client = docker.from_env()
+    # only hit the registry when the image is not already local
+    try:
+        _docker_client.images.get("minio/minio")
+    except docker.errors.ImageNotFound:
+        _docker_client.images.pull("minio/minio")
+    try:
+        _container = _docker_client.containers.run(
+            "minio/minio",
+            command="server /data --address 0.0.0.0:9000 --console-address 0.0.0.0:9001",
+            ports={"9000/tcp": endpoint_port, "9001/tcp": console_port},
+            environment={"MINIO_ROOT_USER": access_key, "MINIO_ROOT_PASSWORD": secret_key},
+            detach=True,
+            name="test-bucket",
+        )
+    except Exception as _:
+        _container = _docker_client.containers.get("test-bucket")
+        _container.restart()
+
+    _wait_ready(host, endpoint_port)
+    atexit.register(_stop)
+    return _container
+
+
+def _wait_ready(host: str, port: str, timeout: float = 10) -> None:
+    deadline = time.time() + timeout
+    # cheap TCP connect probe first — MinIO usually listens within ~200ms,
+    # so the tight loop returns long before an HTTP round trip would
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, int(port)), timeout=0.2):
+                break
+        except OSError:
+            time.sleep(0.05)
+    # then confirm the server actually answers its liveness endpoint
+    url = f"http://{host}:{port}/minio/health/live"
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"MinIO at {url} did not become healthy within {timeout}s")
+
+
+def _stop() -> None:
+    global _container, _docker_client
+    if _container is not None:
+        _container.stop()
+        _container.remove(force=True)
+        _container = None
+    if _docker_client is not None:
+        _docker_client.close()
+        _docker_client = None
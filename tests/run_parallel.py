@@ -0,0 +1,44 @@
+"""
+Runs the sync S3 client tests concurrently.
+
+The tests are latency-bound on MinIO round-trips and isolated by
+per-test uuid prefixes and per-test download directories, so they can
+safely share the class-level client (boto3 clients are thread-safe)
+across worker threads.
+
+Usage: python -m tests.run_parallel [workers]
+"""
+
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.tests_sync import TestS3Client
+
+
+def main(workers: int = 8) -> int:
+    TestS3Client.setUpClass()
+    try:
+        names = unittest.TestLoader().getTestCaseNames(TestS3Client)
+
+        def run_one(name):
+            result = unittest.TestResult()
+            TestS3Client(name)(result)
+            return name, result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_one, names))
+    finally:
+        TestS3Client.tearDownClass()
+
+    failed = 0
+    for name, result in results:
+        for test, traceback in result.failures + result.errors:
+            failed += 1
+            print(f"FAILED: {test}\n{traceback}")
+    print(f"{len(results)} tests, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8))
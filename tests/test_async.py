@@ -1,173 +1,147 @@
 import unittest
-import configparser
+import asyncio
+import uuid
 import logging
-import docker
-from pathlib import Path
-import time
-import os
+from shutil import rmtree
+from botocore.exceptions import ClientError
 from botowrapper import AsyncS3Client
-import aiofiles
-
-logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+import io
 
+from tests._base import MinIOBackedTestBase, _BOTO_CFG, _count
 
-class TestAsyncS3Client(unittest.IsolatedAsyncioTestCase):
-    @classmethod
-    def setUpClass(cls):
-        config = configparser.ConfigParser()
-        config.read(str(Path(__file__).parent) + "\\.cfg")
+logging.getLogger("asyncio").setLevel(logging.CRITICAL)
 
-        minio_config = config["minio"]
-        cls.access_key = minio_config.get("access_key")
-        cls.secret_key = minio_config.get("secret_key")
-        cls.bucket_name = minio_config.get("bucket_name")
-        cls.host = minio_config.get("host")
-        cls.endpoint_port = minio_config.get("endpoint_port")
-        cls.console_port = minio_config.get("console_port")
 
-        cls.docker_client = docker.from_env()
-        cls.docker_client.images.pull("minio/minio")
-        try:
-            cls.container = cls.docker_client.containers.run(
-                "minio/minio",
-                command="server /data --address 0.0.0.0:9000 --console-address 0.0.0.0:9001",
-                ports={"9000/tcp": cls.endpoint_port, "9001/tcp": cls.console_port},
-                environment={"MINIO_ROOT_USER": cls.access_key, "MINIO_ROOT_PASSWORD": cls.secret_key},
-                detach=True,
-                name="test-bucket",
-                healthcheck={
-                    "Test": ["CMD", "curl", "-f", "http://localhost:9000/minio/health/live"],
-                    "Interval": 30000000000,
-                    "Timeout": 20000000000,
-                    "Retries": 3,
-                },
-            )
-        except Exception as _:
-            cls.container = cls.docker_client.containers.get("test-bucket")
-            cls.container.restart()
-        time.sleep(5)
-
-        cls.testfiles = Path(__file__).parent / "testfiles"
-        cls.testdownloaded = Path(__file__).parent / "testdownloaded"
-        cls.testfiles.mkdir(parents=True, exist_ok=True)
-        cls.testdownloaded.mkdir(parents=True, exist_ok=True)
-
-        for i in range(100):
-            with open(cls.testfiles / f"test{i}.txt", "w") as f:
-                f.write(f"Test file {i}")
-
-    @classmethod
-    def tearDownClass(cls):
-        cls.container.stop()
-        cls.container.remove(force=True)
-        cls.docker_client.close()
+class TestAsyncS3Client(MinIOBackedTestBase, unittest.IsolatedAsyncioTestCase):
+    # container, config and fixture files come from the shared base's
+    # setUpClass; their teardown is handled by its atexit hooks
 
     async def asyncSetUp(self):
         self.async_client = AsyncS3Client(
             bucketname=self.bucket_name,
-            max_concurency=50,
+            max_concurrency=50,
             region_name="local",
             endpoint_url=f"http://{self.host}:{self.endpoint_port}",
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
+            config=_BOTO_CFG,
         )
         await self.async_client.create_bucket(self.bucket_name)
+        # unique prefix per test: no cross-test interference, so the bucket
+        # does not need to be emptied between tests (the shared container is
+        # discarded at process exit anyway)
+        self._prefix = "p" + uuid.uuid4().hex
+        self._new_prefix = self._prefix + "_new"
+        # the wrapper's shared client, grabbed once per test instead of
+        # being re-resolved before every raw assertion call. Hoisting it to
+        # the class is not possible: IsolatedAsyncioTestCase runs each test
+        # on a fresh event loop, and an aiobotocore client is bound to the
+        # loop it was created on.
+        self._s3 = await self.async_client._ensure_client()
 
     async def asyncTearDown(self):
-        await self.delete_all_objects()
-        for f in self.testdownloaded.iterdir():
-            os.remove(f)
+        # close the pooled client on the loop that owns it; otherwise the
+        # connector is leaked when the per-test loop is torn down
+        await self.async_client.__aexit__(None, None, None)
+        # one directory-level rmtree instead of 100 unlinks blocking the loop
+        rmtree(self.testdownloaded)
+        self.testdownloaded.mkdir()
+
+    async def _key_exists(self, key: str) -> bool:
+        # single HEAD for a one-key existence check instead of listing the
+        # whole bucket just to assertIn
+        try:
+            await self._s3.head_object(Bucket=self.bucket_name, Key=key)
+            return True
+        except ClientError:
+            return False
 
-    async def delete_all_objects(self):
-        async with self.async_client.get_client() as client:
-            response = await client.list_objects_v2(Bucket=self.bucket_name)
-            objects_to_delete = [{"Key": obj["Key"]} for obj in response.get("Contents", [])]
-            if objects_to_delete:
-                await client.delete_objects(Bucket=self.bucket_name, Delete={"Objects": objects_to_delete, "Quiet": True})
+    async def _keys_in(self, prefix: str = "") -> set[str]:
+        # one listing turned into a set, so repeated membership checks in a
+        # test don't re-list the bucket
+        response = await self._s3.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
+        return {obj["Key"] for obj in response.get("Contents", [])}
 
     async def upload_all(self):
-        async with self.async_client.get_client() as client:
-            for f in self.testfiles.iterdir():
-                await client.upload_file(
+        semaphore = asyncio.Semaphore(50)
+
+        # put_object with in-memory bytes skips the disk read and the
+        # transfer-manager setup upload_file pays per 13-byte file
+        async def upload_one(i):
+            async with semaphore:
+                await self._s3.put_object(
                     Bucket=self.bucket_name,
-                    Filename=f,
-                    Key="prefix/" + f.name,
+                    Key=f"{self._prefix}/test{i}.txt",
+                    Body=f"Test file {i}".encode(),
                 )
 
+        await asyncio.gather(*(upload_one(i) for i in range(100)))
+
     async def test_upload_stream(self):
-        async with aiofiles.open(self.testfiles / "test1.txt", "rb") as stream:
-            await self.async_client.upload_stream(stream, "test1_stream.txt")
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name)
-        self.assertIn("test1_stream.txt", [obj["Key"] for obj in objects.get("Contents", [])])
+        key = self._prefix + "_stream.txt"
+        stream = io.BytesIO(b"Test file 1")
+        await self.async_client.upload_stream(stream, key)
+        self.assertTrue(await self._key_exists(key))
 
     async def test_upload_file(self):
+        # the default-key path writes to an unprefixed name, so this one key
+        # is removed inline to keep other upload tests independent
         await self.async_client.upload_file(self.testfiles / "test1.txt")
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name)
-        self.assertIn("test1.txt", [obj["Key"] for obj in objects.get("Contents", [])])
+        self.assertTrue(await self._key_exists("test1.txt"))
+        await self._s3.delete_object(Bucket=self.bucket_name, Key="test1.txt")
 
     async def test_upload_file_with_overwrite(self):
-        await self.async_client.upload_file(self.testfiles / "test1.txt")
-        await self.async_client.upload_file(self.testfiles / "test1.txt", overwrite=True)
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name)
-        self.assertIn("test1.txt", [obj["Key"] for obj in objects.get("Contents", [])])
+        key = self._prefix + "/test1.txt"
+        await self.async_client.upload_file(self.testfiles / "test1.txt", key=key)
+        await self.async_client.upload_file(self.testfiles / "test1.txt", key=key, overwrite=True)
+        self.assertTrue(await self._key_exists(key))
 
     async def test_ls_files(self):
         await self.upload_all()
-        files = [obj["Key"] async for obj in self.async_client.ls_files("prefix")]
+        files = {obj["Key"] async for obj in self.async_client.ls_files(self._prefix)}
         self.assertEqual(len(files), 100)
-        self.assertIn("prefix/test1.txt", files)
+        self.assertIn(self._prefix + "/test1.txt", files)
 
     async def test_download_file(self):
         await self.upload_all()
-        await self.async_client.download("prefix", destination=self.testdownloaded)
+        await self.async_client.download(self._prefix, destination=self.testdownloaded)
         with open(self.testdownloaded / "test1.txt", "r") as f:
             content = f.read()
         self.assertEqual(content, "Test file 1")
-        self.assertEqual(len(list(self.testdownloaded.iterdir())), 100)
+        self.assertEqual(_count(self.testdownloaded), 100)
 
     async def test_copy(self):
         await self.upload_all()
-        await self.async_client.copy("prefix", "newprefix", overwrite=True)
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name, Prefix="newprefix")
-        self.assertEqual(len(objects.get("Contents", [])), 100)
+        await self.async_client.copy(self._prefix, self._new_prefix, overwrite=True)
+        self.assertEqual(len(await self._keys_in(self._new_prefix)), 100)
 
     async def test_move(self):
         await self.upload_all()
-        await self.async_client.move("prefix", "newprefix", overwrite=True)
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name, Prefix="newprefix")
-        self.assertEqual(len(objects.get("Contents", [])), 100)
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name, Prefix="prefix")
-        self.assertEqual(len(objects.get("Contents", [])), 0)
+        await self.async_client.move(self._prefix, self._new_prefix, overwrite=True)
+        self.assertEqual(len(await self._keys_in(self._new_prefix)), 100)
+        self.assertEqual(len(await self._keys_in(self._prefix + "/")), 0)
 
     async def test_remove(self):
         await self.upload_all()
-        await self.async_client.remove("prefix")
-        async with self.async_client.get_client() as client:
-            objects = await client.list_objects_v2(Bucket=self.bucket_name, Prefix="prefix")
-        self.assertEqual(len(objects.get("Contents", [])), 0)
+        await self.async_client.remove(self._prefix)
+        self.assertEqual(len(await self._keys_in(self._prefix + "/")), 0)
 
     async def test_count_files(self):
         await self.upload_all()
-        count = await self.async_client.count_files("prefix")
+        count = await self.async_client.count_files(self._prefix)
         self.assertEqual(count, 100)
 
     async def test_get_sizes(self):
         await self.upload_all()
-        sizes = await self.async_client.get_sizes("prefix")
+        sizes = await self.async_client.get_sizes(self._prefix)
         self.assertEqual(len(sizes), 100)
-        self.assertGreater(sizes["prefix/test1.txt"], 0)
+        self.assertGreater(sizes[self._prefix + "/test1.txt"], 0)
 
     async def test_get_urls(self):
         await self.upload_all()
-        urls = await self.async_client.get_urls("prefix")
+        urls = await self.async_client.get_urls(self._prefix)
         self.assertEqual(len(urls), 100)
-        self.assertTrue(urls["prefix/test1.txt"].startswith("http"))
+        self.assertTrue(urls[self._prefix + "/test1.txt"].startswith("http"))
 
 
 if __name__ == "__main__":